@@ -1,9 +1,12 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field
-import requests
-from agentx.util import get_headers
+import time
+from typing import Optional, List, Dict, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from agentx.util import get_headers, get_session
 from .conversation import Conversation
 
+# Seconds a fetched conversation list is reused before hitting the API again
+CONVERSATIONS_CACHE_TTL = 30.0
+
 
 class Agent(BaseModel):
     id: str = Field(alias="_id")
@@ -12,6 +15,12 @@ class Agent(BaseModel):
     createdAt: Optional[str] = None
     updatedAt: Optional[str] = None
 
+    _conversations_cache: Optional[Tuple[float, List[Conversation]]] = PrivateAttr(
+        default=None
+    )
+    _conversations_by_id: Dict[str, Conversation] = PrivateAttr(default_factory=dict)
+    _conversations_ttl: float = PrivateAttr(default=CONVERSATIONS_CACHE_TTL)
+
     class Config:
         populate_by_name = True
         extra = "ignore"
@@ -20,30 +29,40 @@ class Agent(BaseModel):
         super().__init__(**data)
 
     def get_conversation(self, id: str) -> Conversation:
-        list_of_conversations = self.list_conversations()
-        conversation = next(
-            (conv for conv in list_of_conversations if conv.id == id),
-            None,
-        )
+        from_cache = self._conversations_cache_valid()
+        self.list_conversations()
+        conversation = self._conversations_by_id.get(id)
+        if conversation is None and from_cache:
+            # The conversation may have been created after the cache was filled
+            self.invalidate_conversations()
+            self.list_conversations()
+            conversation = self._conversations_by_id.get(id)
         if conversation is None:
             raise Exception("404 - Conversation not found")
         return conversation
 
     def list_conversations(self) -> List[Conversation]:
+        if self._conversations_cache_valid():
+            return list(self._conversations_cache[1])
         url = f"https://api.agentx.so/api/v1/access/agents/{self.id}/conversations"
-        response = requests.get(url, headers=get_headers())
+        response = get_session().get(url, headers=get_headers())
         if response.status_code == 200:
-            return [
-                Conversation(
-                    agent_id=self.id,
-                    id=conv_res.get("_id"),
-                    title=conv_res.get("title"),
-                    users=conv_res.get("users"),
-                    agents=conv_res.get("bots"),
-                    createdAt=conv_res.get("createdAt"),
-                    updatedAt=conv_res.get("updatedAt"),
-                )
+            conversations = [
+                Conversation(**{**conv_res, "agent_id": self.id})
                 for conv_res in response.json()
             ]
+            self._conversations_cache = (time.monotonic(), conversations)
+            self._conversations_by_id = {conv.id: conv for conv in conversations}
+            return list(conversations)
         else:
             raise Exception(f"Failed to retrieve agent details: {response.reason}")
+
+    def invalidate_conversations(self) -> None:
+        """Drop the cached conversation list so the next call refetches it."""
+        self._conversations_cache = None
+        self._conversations_by_id = {}
+
+    def _conversations_cache_valid(self) -> bool:
+        if self._conversations_cache is None:
+            return False
+        return time.monotonic() - self._conversations_cache[0] < self._conversations_ttl
@@ -1,5 +1,17 @@
 import os
 
+import requests
+
+_session = None
+
 
 def get_headers(api_key: str = None):
     return {"accept": "*/*", "x-api-key": api_key or os.getenv("AGENTX_API_KEY")}
+
+
+def get_session() -> requests.Session:
+    """Shared session so repeated API calls reuse pooled keep-alive connections."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
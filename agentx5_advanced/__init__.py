@@ -17,16 +17,19 @@ Document Date: February 2, 2026
 APPS Holdings WY, Inc.
 """
 
-from agentx5_advanced.orchestrator import (
-    AgentX5Orchestrator,
-    AbacusAgent,
-    SilentPartnerConfig,
-)
-from agentx5_advanced.config.settings import (
-    AGENTX5_CONFIG,
-    ABACUS_CONFIG,
-    DEPLOYMENT_TARGETS,
-)
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that
+# `python -m agentx5_advanced` and single-name imports don't pay for
+# loading the orchestrator and settings modules up front.
+_LAZY_EXPORTS = {
+    "AgentX5Orchestrator": "agentx5_advanced.orchestrator",
+    "AbacusAgent": "agentx5_advanced.orchestrator",
+    "SilentPartnerConfig": "agentx5_advanced.orchestrator",
+    "AGENTX5_CONFIG": "agentx5_advanced.config.settings",
+    "ABACUS_CONFIG": "agentx5_advanced.config.settings",
+    "DEPLOYMENT_TARGETS": "agentx5_advanced.config.settings",
+}
 
 __all__ = [
     "AgentX5Orchestrator",
@@ -40,3 +43,16 @@ __all__ = [
 __version__ = "1.0.0"
 __author__ = "APPS Holdings WY, Inc."
 __document_date__ = "February 2, 2026"
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
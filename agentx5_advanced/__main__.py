@@ -8,35 +8,40 @@ Connects all systems in loop.
 
 import sys
 
+BANNER_LINES = [
+    "=" * 60,
+    "AGENTX5 ADVANCED - SYSTEM ACTIVE",
+    "=" * 60,
+    "",
+    "MODE: DEVELOP (Free Tools)",
+    "PRIMARY: Manus Sandbox (Linux Ubuntu)",
+    "",
+    "SANDBOX ACCESS:",
+    "-" * 40,
+    "Manus:      https://manus.app",
+    "E2B:        https://e2b.dev",
+    "Replit:     https://replit.com",
+    "Codespaces: https://github.com/codespaces",
+    "Vercel:     https://vercel.com",
+    "",
+    "SYSTEMS CONNECTED:",
+    "-" * 40,
+    "[OK] Bank Statement Analyzer",
+    "[OK] Document Merger",
+    "[OK] Manus Automation",
+    "[OK] Legal Templates",
+    "[OK] CETIENT Research",
+    "",
+    "AGENTS: 1500 configured",
+    "",
+    "STATUS: LIVE",
+    "=" * 60,
+]
+
 def main():
     """Main loop - connects all systems."""
-    print("=" * 60)
-    print("AGENTX5 ADVANCED - SYSTEM ACTIVE")
-    print("=" * 60)
-    print()
-    print("MODE: DEVELOP (Free Tools)")
-    print("PRIMARY: Manus Sandbox (Linux Ubuntu)")
-    print()
-    print("SANDBOX ACCESS:")
-    print("-" * 40)
-    print("Manus:      https://manus.app")
-    print("E2B:        https://e2b.dev")
-    print("Replit:     https://replit.com")
-    print("Codespaces: https://github.com/codespaces")
-    print("Vercel:     https://vercel.com")
-    print()
-    print("SYSTEMS CONNECTED:")
-    print("-" * 40)
-    print("[OK] Bank Statement Analyzer")
-    print("[OK] Document Merger")
-    print("[OK] Manus Automation")
-    print("[OK] Legal Templates")
-    print("[OK] CETIENT Research")
-    print()
-    print("AGENTS: 1500 configured")
-    print()
-    print("STATUS: LIVE")
-    print("=" * 60)
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(BANNER_LINES) + "\n")
     return 0
 
 if __name__ == "__main__":
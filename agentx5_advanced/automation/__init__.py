@@ -19,6 +19,9 @@ from agentx5_advanced.automation.integrations import (
     ManusIntegration,
     BoxAirtableSync,
     ZapierWorkflow,
+    BatchedWebhookSender,
+    RateLimitedRetryQueue,
+    dumps_json,
 )
 
 __all__ = [
@@ -29,4 +32,7 @@ __all__ = [
     "ManusIntegration",
     "BoxAirtableSync",
     "ZapierWorkflow",
+    "BatchedWebhookSender",
+    "RateLimitedRetryQueue",
+    "dumps_json",
 ]
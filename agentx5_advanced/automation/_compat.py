@@ -0,0 +1,12 @@
+"""
+AgentX5 Advanced Edition - Automation Compatibility Helpers
+
+Version-dependent settings shared by the automation modules, kept apart
+so importing one module does not pull in another's dependencies.
+"""
+
+import sys
+from typing import Dict
+
+# Instances created in bulk drop their per-instance __dict__ where supported
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
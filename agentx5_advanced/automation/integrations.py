@@ -6,9 +6,308 @@ No upgrades required - uses sandbox environment for heavy operations.
 """
 
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+import json
+import math
+import time
+import random
+import tempfile
+import zipfile
+import heapq
+import asyncio
+import logging
+import uuid
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncContextManager, Awaitable, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, datetime, time as dt_time, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from types import MappingProxyType
+
+import requests
+
+from agentx5_advanced.automation._compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:  # optional: pip install agentx-python[json]
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+AIRTABLE_API_URL = "https://api.airtable.com/v0"
+BOX_UPLOAD_URL = "https://upload.box.com/api/2.0/files/content"
+
+# Already-compressed formats are stored as-is in upload bundles
+_PRECOMPRESSED_EXTENSIONS = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+    ".mp3", ".mp4", ".mov", ".m4a", ".docx", ".xlsx", ".pptx",
+})
+
+# Dict key types orjson's OPT_NON_STR_KEYS converts and stdlib json rejects
+_JSON_KEY_TYPES = (Enum, datetime, date, dt_time, uuid.UUID)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode the non-JSON types config and status dicts may contain.
+
+    Mirrors orjson's native handling (enums by value, datetimes as ISO
+    8601, dataclasses without their _private fields) so the stdlib
+    fallback writes the same bytes.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _json_keys({
+            f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith("_")
+        })
+    if isinstance(obj, MappingProxyType):
+        return _json_keys(dict(obj))
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def _json_keys(obj: Any) -> Any:
+    """Convert enum/date/UUID dict keys the way OPT_NON_STR_KEYS does."""
+    if isinstance(obj, dict):
+        return {
+            (_json_default(k) if isinstance(k, _JSON_KEY_TYPES) else k): _json_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_json_keys(v) for v in obj]
+    return obj
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an API response body, using orjson when it is installed.
+
+    Both backends produce the same compact UTF-8 output, except that
+    NaN/Infinity raise ValueError on the stdlib path where orjson writes
+    null.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    options = dict(
+        default=_json_default, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    )
+    try:
+        return json.dumps(obj, **options).encode()
+    except TypeError:
+        # Enum/date keys: stdlib json only takes str/int/float/bool/None keys
+        return json.dumps(_json_keys(obj), **options).encode()
+
+
+# Provider responses worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503})
+
+# Static sections of the get_config() responses. Frozen here and copied
+# into plain lists/dicts per call, so callers get ordinary JSON-friendly
+# structures and one caller's edits cannot leak into another's response
+_MANUS_USAGE_NOTES = (
+    "Never pay - rotate between 3 accounts",
+    "Use for complex tasks other tools can't handle",
+    "Credits reset daily at midnight",
+)
+
+_ZAPIER_RECOMMENDED_ZAPS = (
+    MappingProxyType({
+        "name": "Box → Airtable Index",
+        "trigger": "New file in Box folder",
+        "action": "Create record in Airtable",
+    }),
+    MappingProxyType({
+        "name": "Airtable → Sandbox",
+        "trigger": "New record with status 'Pending'",
+        "action": "Webhook to sandbox processor",
+    }),
+    MappingProxyType({
+        "name": "Sandbox → Google Docs",
+        "trigger": "Webhook from sandbox",
+        "action": "Create Google Doc with output",
+    }),
+)
+
+_ZAPIER_FREE_ALTERNATIVES = MappingProxyType({
+    "make.com": MappingProxyType({
+        "free_ops": 1000,
+        "url": "https://www.make.com",
+        "note": "Better for high-volume automation",
+    }),
+    "n8n": MappingProxyType({
+        "self_hosted": True,
+        "url": "https://n8n.io",
+        "note": "Unlimited if self-hosted",
+    }),
+    "pipedream": MappingProxyType({
+        "free_invocations": 10000,
+        "url": "https://pipedream.com",
+        "note": "Best free tier for developers",
+    }),
+})
+
+_WEBHOOK_SETUP = """
+# In your Box Developer Console:
+1. Create new app → Custom App
+2. Add webhook → File uploaded
+3. Target URL: https://your-sandbox.com/api/automation/webhook
+
+# In Airtable Automations:
+1. When record matches conditions (Status = 'Pending')
+2. Run script → Send webhook to sandbox
+"""
+
+
+@dataclass
+class RateLimiter:
+    """Sliding-window limiter allowing at most `rate` calls per `per` seconds."""
+    rate: int
+    per: float = 1.0
+    _calls: Deque[float] = field(default_factory=deque, init=False, repr=False)
+
+    def wait(self):
+        """Block until another call fits in the window, then record it."""
+        now = time.monotonic()
+        while self._calls and now - self._calls[0] >= self.per:
+            self._calls.popleft()
+        if len(self._calls) >= self.rate:
+            time.sleep(self.per - (now - self._calls[0]))
+            self._calls.popleft()
+        self._calls.append(time.monotonic())
+
+    async def acquire(self) -> float:
+        """Async wait(); returns the seconds spent waiting for a slot."""
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.per:
+                self._calls.popleft()
+            if len(self._calls) < self.rate:
+                self._calls.append(now)
+                return waited
+            delay = self.per - (now - self._calls[0])
+            waited += delay
+            await asyncio.sleep(delay)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff for a zero-based attempt, plus up to 1s of jitter."""
+    return min(cap, base * 2 ** attempt + random.random())
+
+
+def _retry_after(value: Optional[str], default: float = 30.0) -> float:
+    """Seconds to wait for a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+        return max(0.0, seconds) if math.isfinite(seconds) else default
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError, AttributeError):
+        return default
+
+
+def _status_code(outcome: Any) -> Optional[int]:
+    """HTTP status carried by a response, result dict or raised exception."""
+    if isinstance(outcome, dict):
+        return outcome.get("status_code")
+    status = getattr(outcome, "status_code", None)
+    if status is None:
+        status = getattr(getattr(outcome, "response", None), "status_code", None)
+    return status
+
+
+@dataclass
+class RateLimitedRetryQueue:
+    """
+    Rate-limited retries for calls to free-tier services.
+
+    Calls sharing a key (a host or service name) share one RateLimiter;
+    rate=None disables rate limiting. Results or exceptions carrying a
+    status in RETRYABLE_STATUS_CODES are retried with jittered exponential
+    backoff, up to max_attempts; a result still retryable after the last
+    attempt raises an Exception carrying its status_code.
+    """
+    rate: Optional[int] = 5
+    per: float = 1.0
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    metrics: Dict[str, float] = field(
+        default_factory=lambda: {"retries": 0, "throttled_seconds": 0.0}
+    )
+    _limiters: Dict[str, RateLimiter] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    async def submit(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        guard: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+    ) -> Any:
+        """
+        Run call() under the key's rate limit, retrying retryable outcomes.
+
+        Each attempt runs inside guard() (e.g. a concurrency semaphore)
+        when given; rate-limit waits and backoff sleeps happen outside it.
+        """
+        limiter = None
+        if self.rate is not None:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = RateLimiter(rate=self.rate, per=self.per)
+
+        for attempt in range(self.max_attempts):
+            if limiter is not None:
+                self.metrics["throttled_seconds"] += await limiter.acquire()
+            last_attempt = attempt == self.max_attempts - 1
+            try:
+                if guard is None:
+                    result = await call()
+                else:
+                    async with guard():
+                        result = await call()
+            except Exception as e:
+                if last_attempt or _status_code(e) not in RETRYABLE_STATUS_CODES:
+                    raise
+            else:
+                status = _status_code(result)
+                if status not in RETRYABLE_STATUS_CODES:
+                    return result
+                if last_attempt:
+                    # Out of attempts: don't hand back a throttled/5xx result
+                    # as if it succeeded
+                    error = Exception(
+                        f"Failed to complete {key} call after "
+                        f"{self.max_attempts} attempts: status {status}"
+                    )
+                    error.status_code = status
+                    raise error
+
+            delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+            self.metrics["retries"] += 1
+            self.metrics["throttled_seconds"] += delay
+            logger.info("Retrying %s call in %.1fs (attempt %d)", key, delay, attempt + 1)
+            await asyncio.sleep(delay)
 
 
 # ============================================================================
@@ -118,7 +417,7 @@ class VertexStudioIntegration:
 # MANUS INTEGRATION (FREE - 300 CREDITS/DAY x 3 ACCOUNTS)
 # ============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ManusAccount:
     """Single Manus account configuration."""
     account_id: str
@@ -146,6 +445,14 @@ class ManusIntegration:
     total_daily_credits: int = 900
     tier: str = "FREE"
 
+    # Max-heap of (-credits_remaining, index, account) and running totals,
+    # kept in step by execute_task and checked against the accounts on read
+    _credit_heap: List[Tuple[int, int, ManusAccount]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _total_remaining: int = field(default=0, init=False, repr=False, compare=False)
+    _credits_used_total: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if not self.accounts:
             # Initialize 3 free accounts
@@ -154,12 +461,48 @@ class ManusIntegration:
                 ManusAccount(account_id="manus_2", email="account2@example.com"),
                 ManusAccount(account_id="manus_3", email="account3@example.com"),
             ]
+        self._rebuild_credit_heap()
+
+    def _rebuild_credit_heap(self):
+        """Re-index accounts by remaining credits and recompute the running totals."""
+        self._credit_heap = [
+            (-account.credits_remaining, i, account)
+            for i, account in enumerate(self.accounts)
+        ]
+        heapq.heapify(self._credit_heap)
+        self._total_remaining = sum(a.credits_remaining for a in self.accounts)
+        self._credits_used_total = sum(a.credits_used for a in self.accounts)
+
+    def reset_daily_credits(self):
+        """Start a new day: zero every account's usage and re-index."""
+        for account in self.accounts:
+            account.credits_used = 0
+        self._rebuild_credit_heap()
+
+    def _sync_credit_heap(self):
+        """
+        Re-index if accounts changed outside execute_task.
+
+        Checks every entry against the live accounts, so edits to any
+        account, added/removed/replaced accounts and manual resets are all
+        picked up. With a handful of accounts the scan is negligible.
+        """
+        accounts = self.accounts
+        if len(self._credit_heap) != len(accounts) or any(
+            i >= len(accounts)
+            or accounts[i] is not account
+            or -key != account.credits_remaining
+            for key, i, account in self._credit_heap
+        ) or self._credits_used_total != sum(a.credits_used for a in accounts):
+            self._rebuild_credit_heap()
 
     def get_available_account(self) -> Optional[ManusAccount]:
-        """Get account with available credits."""
-        for account in self.accounts:
-            if account.credits_remaining > 0:
-                return account
+        """Get the account with the most remaining credits."""
+        self._sync_credit_heap()
+        if self._total_remaining <= 0:
+            return None
+        if self._credit_heap and self._credit_heap[0][2].credits_remaining > 0:
+            return self._credit_heap[0][2]
         return None
 
     def execute_task(self, task_url: str) -> Dict[str, Any]:
@@ -174,11 +517,15 @@ class ManusIntegration:
             return {
                 "status": "error",
                 "message": "No credits available. Wait for daily reset.",
-                "total_credits_used": sum(a.credits_used for a in self.accounts),
+                "total_credits_used": self._credits_used_total,
             }
 
-        # Track credit usage
+        # Track credit usage and re-rank the account
         account.credits_used += 1
+        self._credits_used_total += 1
+        self._total_remaining -= 1
+        _, index, _ = self._credit_heap[0]
+        heapq.heapreplace(self._credit_heap, (-account.credits_remaining, index, account))
 
         return {
             "status": "executing",
@@ -190,9 +537,11 @@ class ManusIntegration:
 
     def get_total_remaining(self) -> int:
         """Get total remaining credits across all accounts."""
-        return sum(a.credits_remaining for a in self.accounts)
+        self._sync_credit_heap()
+        return self._total_remaining
 
     def get_config(self) -> Dict[str, Any]:
+        """Config snapshot with live per-account credits."""
         return {
             "provider": "Manus AI",
             "tier": self.tier,
@@ -206,11 +555,7 @@ class ManusIntegration:
                 for a in self.accounts
             ],
             "total_remaining": self.get_total_remaining(),
-            "usage_notes": [
-                "Never pay - rotate between 3 accounts",
-                "Use for complex tasks other tools can't handle",
-                "Credits reset daily at midnight",
-            ],
+            "usage_notes": list(_MANUS_USAGE_NOTES),
         }
 
 
@@ -238,15 +583,32 @@ class BoxAirtableSync:
     box_folder_id: str = "7z35nft4ozw1m93lydgzy4p5edqaizna"
     airtable_base_id: str = ""
     airtable_table_name: str = "FileIndex"
+    airtable_api_key: str = ""
+    box_access_token: str = ""
+    box_upload_folder_id: str = ""
     tier: str = "FREE"
 
     # Capacity
     max_files: int = 12000
     batch_size: int = 100  # Process in batches to stay within free limits
 
+    # Airtable API limits: 10 records per write, 5 requests/sec per base
+    airtable_batch_size: int = 10
+    airtable_rate_limit: int = 5
+    max_attempts: int = 3
+
+    _limiter: RateLimiter = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if not self.airtable_base_id:
             self.airtable_base_id = os.getenv("AIRTABLE_BASE_ID", "")
+        if not self.airtable_api_key:
+            self.airtable_api_key = os.getenv("AIRTABLE_API_KEY", "")
+        if not self.box_access_token:
+            self.box_access_token = os.getenv("BOX_ACCESS_TOKEN", "")
+        if not self.box_upload_folder_id:
+            self.box_upload_folder_id = os.getenv("BOX_UPLOAD_FOLDER_ID", "0")
+        self._limiter = RateLimiter(rate=self.airtable_rate_limit)
 
     def get_config(self) -> Dict[str, Any]:
         return {
@@ -257,6 +619,8 @@ class BoxAirtableSync:
             "capacity": {
                 "max_files": self.max_files,
                 "batch_size": self.batch_size,
+                "airtable_batch_size": self.airtable_batch_size,
+                "rate_limit": f"{self.airtable_rate_limit} rps",
             },
             "flow": [
                 "1. Upload files to Box folder",
@@ -292,11 +656,247 @@ class BoxAirtableSync:
             ],
         }
 
+    def batch_upsert(
+        self,
+        records: List[Dict[str, Any]],
+        merge_on: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Write file index records to Airtable, 10 per request.
+
+        Each record is a dict of Airtable field values. With merge_on
+        (e.g. ["File ID"]), rows matching those fields are updated
+        instead of duplicated.
+        """
+        url = f"{AIRTABLE_API_URL}/{self.airtable_base_id}/{quote(self.airtable_table_name)}"
+        method = "PATCH" if merge_on else "POST"
+        written = []
+
+        records_iter = iter(records)
+        while True:
+            chunk = list(islice(records_iter, self.airtable_batch_size))
+            if not chunk:
+                break
+            body = {"records": [{"fields": fields} for fields in chunk], "typecast": True}
+            if merge_on:
+                body["performUpsert"] = {"fieldsToMergeOn": list(merge_on)}
+            response = self._airtable_request(method, url, body)
+            written.extend(response.json().get("records", []))
+
+        return written
+
+    def bundle_and_upload(
+        self,
+        file_paths: List[str],
+        chunk_files: int = 500,
+        bundle_prefix: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload files to Box as zip bundles instead of one request per file.
+
+        Each bundle holds up to chunk_files files and is sent in a single
+        upload. A Box webhook + Zapier step unpacks bundles and indexes the
+        files to Airtable on the other side.
+
+        Bundle names default to a per-call timestamp + random suffix, since
+        Box rejects an upload whose name already exists in the folder.
+        """
+        if bundle_prefix is None:
+            bundle_prefix = f"agentx5_bundle_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        headers = {"Authorization": f"Bearer {self.box_access_token}"}
+        uploaded = []
+
+        for bundle_index, start in enumerate(range(0, len(file_paths), chunk_files)):
+            entries = self._bundle_arcnames(file_paths[start:start + chunk_files])
+            name = f"{bundle_prefix}_{bundle_index:04d}.zip"
+            # Bundles spill to disk past 64 MiB instead of growing in memory
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+                with zipfile.ZipFile(buffer, "w") as bundle:
+                    for path, arcname in entries:
+                        ext = os.path.splitext(path)[1].lower()
+                        compression = (
+                            zipfile.ZIP_STORED if ext in _PRECOMPRESSED_EXTENSIONS
+                            else zipfile.ZIP_DEFLATED
+                        )
+                        bundle.write(path, arcname=arcname, compress_type=compression)
+
+                buffer.seek(0)
+                attributes = {"name": name, "parent": {"id": self.box_upload_folder_id}}
+                response = requests.post(
+                    BOX_UPLOAD_URL,
+                    headers=headers,
+                    data={"attributes": json.dumps(attributes)},
+                    files={"file": (name, buffer, "application/octet-stream")},
+                    timeout=300,
+                )
+            if response.status_code != 201:
+                raise Exception(
+                    f"Failed to upload bundle {name}: {response.status_code} - {response.reason}"
+                )
+            uploaded.append({"bundle": name, "files": len(entries), "box": response.json()})
+
+        return uploaded
+
+    @staticmethod
+    def _bundle_arcnames(paths: List[str]) -> List[Tuple[str, str]]:
+        """
+        Pair each file with a unique name inside its bundle.
+
+        Names are paths relative to the files' common folder, so
+        a/statement.pdf and b/statement.pdf stay distinct. Repeated
+        paths are bundled once.
+        """
+        absolute = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+        if not absolute:
+            return []
+        root = os.path.commonpath([os.path.dirname(path) for path in absolute])
+        return [
+            (path, os.path.relpath(path, root).replace(os.sep, "/"))
+            for path in absolute
+        ]
+
+    def _airtable_request(self, method: str, url: str, body: Dict[str, Any]) -> requests.Response:
+        """Send one rate-limited Airtable write, retrying 429 and 5xx responses."""
+        headers = {"Authorization": f"Bearer {self.airtable_api_key}"}
+        for attempt in range(1, self.max_attempts + 1):
+            self._limiter.wait()
+            response = requests.request(method, url, headers=headers, json=body, timeout=30)
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_attempts:
+                break
+            if response.status_code == 429:
+                # Airtable locks the base for 30 seconds after a rate-limit hit
+                time.sleep(_retry_after(response.headers.get("Retry-After")))
+            else:
+                time.sleep(backoff_delay(attempt))
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to write Airtable records: {response.status_code} - {response.reason}"
+            )
+        return response
+
 
 # ============================================================================
 # ZAPIER FREE AUTOMATION
 # ============================================================================
 
+@dataclass
+class BatchedWebhookSender:
+    """
+    Debounced webhook sender.
+
+    Every Zapier webhook hit costs one task (100/month free), so events
+    are coalesced and POSTed as a single JSON array once the batch window
+    closes or the batch grows past the size limit. Events sharing an
+    event_id are deduplicated, latest wins.
+
+    Knobs: WEBHOOK_BATCH_TIMEOUT_SECONDS (default 5),
+    WEBHOOK_BATCH_SIZE_LIMIT_BYTES (default 1 MiB).
+    """
+    webhook_url: str
+    timeout_seconds: float = field(
+        default_factory=lambda: float(os.getenv("WEBHOOK_BATCH_TIMEOUT_SECONDS", "5"))
+    )
+    size_limit_bytes: int = field(
+        default_factory=lambda: int(os.getenv("WEBHOOK_BATCH_SIZE_LIMIT_BYTES", str(1024 * 1024)))
+    )
+    max_attempts: int = 3
+
+    _pending: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+    _pending_sizes: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _pending_bytes: int = field(default=0, init=False, repr=False)
+    _next_key: int = field(default=0, init=False, repr=False)
+    # Batch-window timer and flush lock, bound to the running loop
+    _timer: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False, repr=False)
+
+    async def enqueue(self, event: Dict[str, Any]) -> None:
+        """Queue an event for the next batched POST."""
+        loop = self._bind_loop()
+        if "event_id" in event:
+            key = str(event["event_id"])
+        else:
+            key = f"_anon_{self._next_key}"
+            self._next_key += 1
+
+        size = len(json.dumps(event, default=str))
+        self._pending_bytes += size - self._pending_sizes.get(key, 0)
+        self._pending[key] = event
+        self._pending_sizes[key] = size
+
+        if self._pending_bytes >= self.size_limit_bytes:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = loop.create_task(self._flush_after_timeout())
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Re-arm loop-bound state when called from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A timer from a finished loop will never fire; events it was
+            # holding go out with the next batch on this loop
+            self._loop = loop
+            self._timer = None
+            self._lock = asyncio.Lock()
+        return loop
+
+    async def _flush_after_timeout(self):
+        try:
+            await asyncio.sleep(self.timeout_seconds)
+        except asyncio.CancelledError:
+            # flush() clears _timer before cancelling it; still being the
+            # timer here means the loop is shutting down with events queued
+            if self._timer is asyncio.current_task() and self._pending:
+                logger.warning(
+                    "Event loop stopped with %d webhook events unsent; "
+                    "call aclose() before exiting", len(self._pending),
+                )
+            raise
+        self._timer = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Send everything queued so far. Returns the number of events sent."""
+        self._bind_loop()
+        async with self._lock:
+            if self._timer is not None:
+                timer, self._timer = self._timer, None
+                timer.cancel()
+            if not self._pending:
+                return 0
+
+            events = list(self._pending.values())
+            self._pending = {}
+            self._pending_sizes = {}
+            self._pending_bytes = 0
+
+            loop = asyncio.get_running_loop()
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    response = await loop.run_in_executor(
+                        None,
+                        lambda: requests.post(self.webhook_url, json=events, timeout=30),
+                    )
+                    if response.status_code < 400:
+                        return len(events)
+                    error = f"{response.status_code} - {response.reason}"
+                except requests.RequestException as e:
+                    error = str(e)
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(2 ** attempt)
+
+            logger.warning(
+                "Dropped %d webhook events after %d attempts: %s",
+                len(events), self.max_attempts, error,
+            )
+            return 0
+
+    async def aclose(self) -> None:
+        """Flush remaining events and stop the pending timer."""
+        await self.flush()
+
+
 @dataclass
 class ZapierWorkflow:
     """
@@ -310,8 +910,24 @@ class ZapierWorkflow:
     tier: str = "FREE"
     monthly_tasks: int = 100
     max_zaps: int = 5
+    webhook_url: str = ""
+
+    _sender: Optional[BatchedWebhookSender] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if not self.webhook_url:
+            self.webhook_url = os.getenv("ZAPIER_WEBHOOK_URL", "")
+
+    def get_webhook_sender(self) -> BatchedWebhookSender:
+        """Shared batched sender for components that emit pipeline events."""
+        if self._sender is None:
+            self._sender = BatchedWebhookSender(webhook_url=self.webhook_url)
+        return self._sender
 
     def get_config(self) -> Dict[str, Any]:
+        """Zapier config, copied from the frozen module constants on each call."""
         return {
             "provider": "Zapier",
             "tier": self.tier,
@@ -319,58 +935,26 @@ class ZapierWorkflow:
                 "monthly_tasks": self.monthly_tasks,
                 "max_zaps": self.max_zaps,
             },
-            "recommended_zaps": [
-                {
-                    "name": "Box → Airtable Index",
-                    "trigger": "New file in Box folder",
-                    "action": "Create record in Airtable",
-                },
-                {
-                    "name": "Airtable → Sandbox",
-                    "trigger": "New record with status 'Pending'",
-                    "action": "Webhook to sandbox processor",
-                },
-                {
-                    "name": "Sandbox → Google Docs",
-                    "trigger": "Webhook from sandbox",
-                    "action": "Create Google Doc with output",
-                },
-            ],
+            "recommended_zaps": [dict(zap) for zap in _ZAPIER_RECOMMENDED_ZAPS],
             "free_alternatives": {
-                "make.com": {
-                    "free_ops": 1000,
-                    "url": "https://www.make.com",
-                    "note": "Better for high-volume automation",
-                },
-                "n8n": {
-                    "self_hosted": True,
-                    "url": "https://n8n.io",
-                    "note": "Unlimited if self-hosted",
-                },
-                "pipedream": {
-                    "free_invocations": 10000,
-                    "url": "https://pipedream.com",
-                    "note": "Best free tier for developers",
-                },
+                name: dict(alt) for name, alt in _ZAPIER_FREE_ALTERNATIVES.items()
             },
         }
 
-    def get_webhook_config(self) -> Dict[str, str]:
+    def get_webhook_config(self) -> Dict[str, Any]:
         """Get webhook configuration for custom automation."""
+        sender = self.get_webhook_sender()
         return {
             "box_webhook": "Configure in Box Developer Console",
             "airtable_webhook": "Use Airtable Automations (free)",
             "custom_endpoint": "/api/automation/webhook",
-            "setup": """
-# In your Box Developer Console:
-1. Create new app → Custom App
-2. Add webhook → File uploaded
-3. Target URL: https://your-sandbox.com/api/automation/webhook
-
-# In Airtable Automations:
-1. When record matches conditions (Status = 'Pending')
-2. Run script → Send webhook to sandbox
-""",
+            "batching": {
+                "webhook_url": sender.webhook_url,
+                "timeout_seconds": sender.timeout_seconds,
+                "size_limit_bytes": sender.size_limit_bytes,
+                "note": "Events are coalesced into one POST per window (1 Zap task per batch)",
+            },
+            "setup": _WEBHOOK_SETUP,
         }
 
 
@@ -378,20 +962,51 @@ class ZapierWorkflow:
 # COMPLETE FREE AUTOMATION CONFIG
 # ============================================================================
 
-FREE_AUTOMATION_CONFIG = {
-    "gemini": GeminiIntegration(),
-    "vertex": VertexStudioIntegration(),
-    "manus": ManusIntegration(),
-    "box_airtable": BoxAirtableSync(),
-    "zapier": ZapierWorkflow(),
+# Integrations are built on first lookup, not at import time
+FREE_AUTOMATION_FACTORIES = {
+    "gemini": GeminiIntegration,
+    "vertex": VertexStudioIntegration,
+    "manus": ManusIntegration,
+    "box_airtable": BoxAirtableSync,
+    "zapier": ZapierWorkflow,
 }
 
 
+@lru_cache(maxsize=None)
+def _build_free_integration(name: str) -> Any:
+    return FREE_AUTOMATION_FACTORIES[name]()
+
+
 def get_free_integration(name: str) -> Any:
-    """Get a free integration by name."""
-    return FREE_AUTOMATION_CONFIG.get(name)
+    """Get a free integration by name (one shared instance per name)."""
+    # Unknown names never reach the cache, so arbitrary lookups can't grow it
+    if name not in FREE_AUTOMATION_FACTORIES:
+        return None
+    return _build_free_integration(name)
+
+
+class _FreeAutomationConfig(Mapping):
+    """Read-only name -> integration mapping that builds entries on access."""
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in FREE_AUTOMATION_FACTORIES:
+            raise KeyError(name)
+        return _build_free_integration(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in FREE_AUTOMATION_FACTORIES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FREE_AUTOMATION_FACTORIES)
+
+    def __len__(self) -> int:
+        return len(FREE_AUTOMATION_FACTORIES)
+
+
+# Kept for existing imports; same instances as get_free_integration()
+FREE_AUTOMATION_CONFIG: Mapping = _FreeAutomationConfig()
 
 
 def list_free_integrations() -> List[str]:
     """List all available free integrations."""
-    return list(FREE_AUTOMATION_CONFIG.keys())
+    return list(FREE_AUTOMATION_FACTORIES.keys())
@@ -7,12 +7,30 @@ Mobile-accessible via API endpoints.
 """
 
 import os
+import sys
+import glob
+import gzip
+import json
+import time
 import asyncio
-from typing import Dict, List, Any, Optional
+import hashlib
+import itertools
+import logging
+import secrets
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import ClassVar, Deque, Dict, FrozenSet, Iterator, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+from agentx5_advanced.automation._compat import DATACLASS_SLOTS
+from agentx5_advanced.automation.integrations import RateLimitedRetryQueue, dumps_json
+
+
+logger = logging.getLogger(__name__)
+
 
 class TaskStatus(Enum):
     """Status of automation tasks."""
@@ -32,7 +50,7 @@ class TaskPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AutomationTask:
     """Single automation task."""
     task_id: str
@@ -40,16 +58,71 @@ class AutomationTask:
     input_data: Dict[str, Any]
     status: TaskStatus = TaskStatus.PENDING
     priority: TaskPriority = TaskPriority.MEDIUM
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = None
+    # Epoch nanoseconds; rendered to ISO strings only when read
+    created_at_ns: int = field(default_factory=time.time_ns)
+    completed_at_ns: Optional[int] = None
     output_location: Optional[str] = None
     error_message: Optional[str] = None
 
+    def __post_init__(self):
+        # Task types come from a small fixed set; share one string object each
+        self.task_type = sys.intern(self.task_type)
+
+    @property
+    def created_at(self) -> str:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9).isoformat()
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        if self.completed_at_ns is None:
+            return None
+        return datetime.fromtimestamp(self.completed_at_ns / 1e9).isoformat()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "task_type": self.task_type,
+            "input_data": self.input_data,
+            "status": self.status.value,
+            "priority": self.priority.value,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "output_location": self.output_location,
+            "error_message": self.error_message,
+        }
+
 
 # ============================================================================
 # SANDBOX EXECUTOR - FREE TIER HEAVY PROCESSING
 # ============================================================================
 
+_SETUP_CODE = '''# Sandbox Environment Setup
+import asyncio
+from agentx5_advanced.automation import SandboxExecutor, AutomationTask
+
+# Initialize executor
+executor = SandboxExecutor(
+    output_folder="google_docs",  # or "box"
+    batch_size=100,
+    concurrent_tasks=5,
+)
+
+# Create tasks from your file list
+tasks = [
+    AutomationTask(
+        task_id=f"task_{i}",
+        task_type="file_processing",
+        input_data={"file_path": file_path},
+    )
+    for i, file_path in enumerate(your_file_list)
+]
+
+# Execute in sandbox
+results = asyncio.run(executor.execute_batch(tasks))
+print(f"Processed {len(results)} tasks")
+'''
+
+
 @dataclass
 class SandboxExecutor:
     """
@@ -72,6 +145,23 @@ class SandboxExecutor:
     batch_size: int = 100
     concurrent_tasks: int = 5
 
+    # Output writes per second per destination (None = unlimited);
+    # 429/5xx results are retried either way
+    output_rate_limit: Optional[int] = None
+
+    _retry_queue: RateLimitedRetryQueue = field(init=False, repr=False, compare=False)
+
+    # Caps in-flight tasks at concurrent_tasks; bound to the running loop
+    _semaphore: Optional[asyncio.Semaphore] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _semaphore_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._retry_queue = RateLimitedRetryQueue(rate=self.output_rate_limit)
+
     def get_config(self) -> Dict[str, Any]:
         return {
             "executor": "Sandbox",
@@ -108,20 +198,29 @@ class SandboxExecutor:
         for i in range(0, len(tasks), self.batch_size):
             batch = tasks[i:i + self.batch_size]
 
+            # Identical tasks (same type + input) are processed once and
+            # share the result
+            keys = [self._dedup_key(task) for task in batch]
+            unique: Dict[bytes, AutomationTask] = {}
+            for key, task in zip(keys, batch):
+                unique.setdefault(key, task)
+
             # Process batch concurrently
-            batch_results = await asyncio.gather(
-                *[self._process_task(task, output_folder) for task in batch],
+            unique_results = await asyncio.gather(
+                *[self._process_task(task, output_folder) for task in unique.values()],
                 return_exceptions=True
             )
+            result_by_key = dict(zip(unique, unique_results))
 
-            for task, result in zip(batch, batch_results):
+            for key, task in zip(keys, batch):
+                result = result_by_key[key]
                 if isinstance(result, Exception):
                     task.status = TaskStatus.FAILED
                     task.error_message = str(result)
                 else:
                     task.status = TaskStatus.COMPLETED
                     task.output_location = result.get("output_url")
-                    task.completed_at = datetime.now().isoformat()
+                    task.completed_at_ns = time.time_ns()
 
                 results.append({
                     "task_id": task.task_id,
@@ -132,12 +231,31 @@ class SandboxExecutor:
 
         return results
 
+    @staticmethod
+    def _dedup_key(task: AutomationTask) -> bytes:
+        """Stable digest of a task's type and input data."""
+        payload = json.dumps([task.task_type, task.input_data], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
     async def _process_task(
         self,
         task: AutomationTask,
         output_folder: str,
     ) -> Dict[str, Any]:
         """Process single task in sandbox."""
+        # Only the attempt itself holds a concurrency slot; retry backoff
+        # sleeps outside it
+        return await self._retry_queue.submit(
+            output_folder,
+            lambda: self._run_task(task, output_folder),
+            guard=self._get_semaphore,
+        )
+
+    async def _run_task(
+        self,
+        task: AutomationTask,
+        output_folder: str,
+    ) -> Dict[str, Any]:
         # Simulate processing (replace with actual logic)
         await asyncio.sleep(0.1)
 
@@ -147,33 +265,21 @@ class SandboxExecutor:
             "output_url": f"https://{output_folder}/{task.task_id}_output",
         }
 
-    def get_setup_code(self) -> str:
-        """Get sandbox setup code."""
-        return '''# Sandbox Environment Setup
-import asyncio
-from agentx5_advanced.automation import SandboxExecutor, AutomationTask
-
-# Initialize executor
-executor = SandboxExecutor(
-    output_folder="google_docs",  # or "box"
-    batch_size=100,
-    concurrent_tasks=5,
-)
+    def get_retry_metrics(self) -> Dict[str, float]:
+        """Retry count and seconds spent throttled or backing off."""
+        return dict(self._retry_queue.metrics)
 
-# Create tasks from your file list
-tasks = [
-    AutomationTask(
-        task_id=f"task_{i}",
-        task_type="file_processing",
-        input_data={"file_path": file_path},
-    )
-    for i, file_path in enumerate(your_file_list)
-]
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore for the running loop (each asyncio.run() gets a fresh one)."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrent_tasks)
+            self._semaphore_loop = loop
+        return self._semaphore
 
-# Execute in sandbox
-results = asyncio.run(executor.execute_batch(tasks))
-print(f"Processed {len(results)} tasks")
-'''
+    def get_setup_code(self) -> str:
+        """Get sandbox setup code."""
+        return _SETUP_CODE
 
 
 # ============================================================================
@@ -196,6 +302,15 @@ class TaskRouter:
     3. Manus (900 credits/day across 3 accounts)
     """
 
+    # Task types that need Manus-level handling
+    _COMPLEX_TYPES: ClassVar[FrozenSet[str]] = frozenset({
+        "legal_drafting", "forensic_analysis", "research",
+    })
+
+    # Manus accounts in fill order, each with its own daily credit bucket
+    _MANUS_ACCOUNTS: ClassVar[Tuple[str, ...]] = ("manus_1", "manus_2", "manus_3")
+    _MANUS_ACCOUNT_CREDITS: ClassVar[int] = 300
+
     # Service quotas (daily)
     gemini_quota: int = 1500
     gemini_used: int = 0
@@ -235,19 +350,12 @@ class TaskRouter:
     def _assess_complexity(self, task: AutomationTask) -> str:
         """Assess task complexity."""
         # Simple heuristic - can be enhanced
-        complex_types = ["legal_drafting", "forensic_analysis", "research"]
-        if task.task_type in complex_types:
-            return "complex"
-        return "simple"
+        return "complex" if task.task_type in self._COMPLEX_TYPES else "simple"
 
     def _get_manus_account(self) -> str:
         """Get Manus account with available credits."""
-        account_credits = self.manus_used // 3
-        if account_credits < 100:
-            return "manus_1"
-        elif account_credits < 200:
-            return "manus_2"
-        return "manus_3"
+        index = min(self.manus_used // self._MANUS_ACCOUNT_CREDITS, len(self._MANUS_ACCOUNTS) - 1)
+        return self._MANUS_ACCOUNTS[index]
 
     def route_manus_link(self, task_url: str) -> Dict[str, Any]:
         """
@@ -274,6 +382,14 @@ class TaskRouter:
             "instruction": f"Task sent to {account}. Check Manus dashboard for progress.",
         }
 
+    def _manus_account_remaining(self) -> Dict[str, int]:
+        """Remaining credits per Manus account (accounts fill in order)."""
+        per_account = self._MANUS_ACCOUNT_CREDITS
+        return {
+            account: min(per_account, max(0, per_account * (i + 1) - self.manus_used))
+            for i, account in enumerate(self._MANUS_ACCOUNTS)
+        }
+
     def get_status(self) -> Dict[str, Any]:
         """Get current routing status."""
         return {
@@ -286,11 +402,7 @@ class TaskRouter:
                 "used": self.manus_used,
                 "quota": self.manus_quota,
                 "remaining": self.manus_quota - self.manus_used,
-                "accounts": {
-                    "manus_1": min(300, max(0, 300 - self.manus_used)),
-                    "manus_2": min(300, max(0, 600 - self.manus_used)),
-                    "manus_3": min(300, max(0, 900 - self.manus_used)),
-                },
+                "accounts": self._manus_account_remaining(),
             },
             "agentx5": {
                 "agents_active": self.agentx5_agents,
@@ -303,6 +415,35 @@ class TaskRouter:
 # AUTOMATION PIPELINE - COMPLETE FLOW
 # ============================================================================
 
+# Static mobile-access config, deep-frozen; get_mobile_config() hands out
+# plain copies
+_MOBILE_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "description": "Control automation from your phone",
+    "endpoints": MappingProxyType({
+        "GET /api/pipeline/status": "Check pipeline status",
+        "POST /api/pipeline/task": "Add new task",
+        "POST /api/pipeline/manus": "Add Manus task URL",
+        "POST /api/pipeline/process": "Process pending tasks",
+    }),
+    "ios_shortcuts": (
+        MappingProxyType({
+            "name": "Check AgentX5 Status",
+            "action": "GET /api/pipeline/status",
+        }),
+        MappingProxyType({
+            "name": "Add Manus Task",
+            "action": "POST /api/pipeline/manus",
+            "input": "Task URL",
+        }),
+    ),
+    "notifications": MappingProxyType({
+        "on_complete": True,
+        "on_error": True,
+        "channel": "push_notification",
+    }),
+})
+
+
 @dataclass
 class AutomationPipeline:
     """
@@ -325,12 +466,42 @@ class AutomationPipeline:
 
     # Processing queue
     pending_tasks: List[AutomationTask] = field(default_factory=list)
-    completed_tasks: List[AutomationTask] = field(default_factory=list)
+    completed_tasks: Deque[AutomationTask] = field(default_factory=deque)
 
     # Output locations
     google_docs_folder: str = ""
     box_output_folder: str = ""
 
+    # Completed tasks beyond the hot limit move to daily gzipped JSONL files
+    completed_hot_limit: int = 1024
+    archive_dir: str = ""
+
+    # Manus task ids: random per-process prefix plus a counter, unique
+    # across processes and within one second
+    _manus_boot_id: ClassVar[str] = secrets.token_hex(4)
+    _manus_task_counter: ClassVar[Iterator[int]] = itertools.count()
+
+    # Streaming mode: submit() feeds a bounded queue drained by worker tasks
+    stream_queue_size: int = 1024
+
+    _archived_count: int = field(default=0, init=False, repr=False, compare=False)
+    _archiving: bool = field(default=False, init=False, repr=False, compare=False)
+    # Streamed tasks that failed since the last drain()
+    _stream_failed: int = field(default=0, init=False, repr=False, compare=False)
+    # Serializes archive appends made from executor threads
+    _archive_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _queue: Optional[asyncio.Queue] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _queue_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _workers: List[asyncio.Task] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         self.google_docs_folder = os.getenv(
             "GOOGLE_DOCS_FOLDER",
@@ -340,6 +511,11 @@ class AutomationPipeline:
             "BOX_OUTPUT_FOLDER",
             "AgentX5_Output"
         )
+        if not self.archive_dir:
+            self.archive_dir = os.getenv(
+                "COMPLETED_ARCHIVE_DIR",
+                os.path.expanduser("~/.agentx5/completed_archive")
+            )
 
     def add_task(self, task: AutomationTask) -> Dict[str, Any]:
         """Add task to pipeline."""
@@ -368,7 +544,7 @@ class AutomationPipeline:
             return routing
 
         task = AutomationTask(
-            task_id=f"manus_{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            task_id=f"manus_{self._manus_boot_id}_{next(self._manus_task_counter)}",
             task_type="manus_task",
             input_data={"url": task_url},
             priority=TaskPriority.HIGH,
@@ -391,12 +567,13 @@ class AutomationPipeline:
             self.google_docs_folder,
         )
 
-        # Move completed to completed list
-        completed = [t for t in self.pending_tasks if t.status == TaskStatus.COMPLETED]
+        # Move completed to completed list, keep failed for retry (one pass)
+        completed, remaining = [], []
+        for t in self.pending_tasks:
+            (completed if t.status == TaskStatus.COMPLETED else remaining).append(t)
         self.completed_tasks.extend(completed)
-
-        # Keep failed for retry
-        self.pending_tasks = [t for t in self.pending_tasks if t.status != TaskStatus.COMPLETED]
+        self.pending_tasks = remaining
+        await self._archive_overflow()
 
         return {
             "processed": len(results),
@@ -405,18 +582,155 @@ class AutomationPipeline:
             "output_folder": self.google_docs_folder,
         }
 
+    async def submit(self, task: AutomationTask) -> Dict[str, Any]:
+        """
+        Stream a task to the sandbox workers.
+
+        Waits while the queue is full, so producers of large file lists
+        never hold more than stream_queue_size tasks in memory.
+        """
+        routing = self.router.route_task(task)
+        task.status = TaskStatus.QUEUED
+        queue = self._get_queue()
+        await queue.put(task)
+        return {
+            "task_id": task.task_id,
+            "status": "queued",
+            "routing": routing,
+            "position": queue.qsize(),
+        }
+
+    async def drain(self) -> Dict[str, Any]:
+        """Wait until every submitted task has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+        failed, self._stream_failed = self._stream_failed, 0
+        return {
+            "completed": len(self.completed_tasks) + self._archived_count,
+            "failed": failed,
+            "output_folder": self.google_docs_folder,
+        }
+
+    async def aclose(self):
+        """Stop the streaming workers."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._queue_loop = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Queue and workers for the running loop, started on first use."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._queue_loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.stream_queue_size)
+            self._queue_loop = loop
+            self._workers = [
+                loop.create_task(self._worker(self._queue))
+                for _ in range(self.sandbox.concurrent_tasks)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            task = await queue.get()
+            try:
+                try:
+                    await self.sandbox.execute_batch([task], self.google_docs_folder)
+                except Exception as e:
+                    # One bad task must not take the worker down with it
+                    logger.exception("Streamed task %s failed", task.task_id)
+                    task.status = TaskStatus.FAILED
+                    task.error_message = str(e)
+                if task.status == TaskStatus.COMPLETED:
+                    self.completed_tasks.append(task)
+                    await self._archive_overflow()
+                else:
+                    # Failed tasks wait in pending_tasks for process_pending to retry
+                    self.pending_tasks.append(task)
+                    self._stream_failed += 1
+            except Exception:
+                logger.exception("Failed to record streamed task %s", task.task_id)
+            finally:
+                queue.task_done()
+
+    async def _archive_overflow(self):
+        """
+        Append completed tasks beyond completed_hot_limit to today's archive.
+
+        Tasks leave memory only after the write succeeds; on failure they
+        stay in completed_tasks and the next call retries them.
+        """
+        overflow = len(self.completed_tasks) - self.completed_hot_limit
+        if overflow <= 0 or self._archiving:
+            return
+        # Only this method pops from the left, so the head is stable while
+        # the write runs; _archiving keeps concurrent workers from
+        # archiving the same tasks twice
+        self._archiving = True
+        try:
+            lines = [
+                dumps_json(task.to_dict()) + b"\n"
+                for task in itertools.islice(self.completed_tasks, overflow)
+            ]
+            path = os.path.join(
+                self.archive_dir, f"completed_{datetime.now().strftime('%Y%m%d')}.jsonl.gz"
+            )
+            # gzip + disk I/O stays off the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_archive, path, lines
+            )
+        except Exception:
+            logger.exception(
+                "Failed to archive %d completed tasks to %s", overflow, self.archive_dir
+            )
+            return
+        finally:
+            self._archiving = False
+        for _ in range(overflow):
+            self.completed_tasks.popleft()
+        self._archived_count += overflow
+
+    def _write_archive(self, path: str, lines: List[bytes]):
+        with self._archive_lock:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            with gzip.open(path, "ab", compresslevel=1) as archive:
+                archive.writelines(lines)
+
+    def find_completed(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a completed task in memory first, then in the archive."""
+        for task in self.completed_tasks:
+            if task.task_id == task_id:
+                return task.to_dict()
+        # Newest archive first; recently completed tasks are looked up most
+        pattern = os.path.join(self.archive_dir, "completed_*.jsonl.gz")
+        with self._archive_lock:
+            for path in sorted(glob.glob(pattern), reverse=True):
+                with gzip.open(path, "rb") as archive:
+                    for line in archive:
+                        record = json.loads(line)
+                        if record["task_id"] == task_id:
+                            return record
+        return None
+
     def get_status(self) -> Dict[str, Any]:
         """Get pipeline status - accessible from phone."""
         return {
             "pipeline_status": "active",
             "box_folder": self.box_folder_url,
             "pending_tasks": len(self.pending_tasks),
-            "completed_tasks": len(self.completed_tasks),
+            "completed_tasks": len(self.completed_tasks) + self._archived_count,
+            "completed_storage": {
+                "hot": len(self.completed_tasks),
+                "archived": self._archived_count,
+            },
             "output_locations": {
                 "google_docs": self.google_docs_folder,
                 "box": self.box_output_folder,
             },
             "service_quotas": self.router.get_status(),
+            "retries": self.sandbox.get_retry_metrics(),
             "mobile_endpoints": {
                 "status": "/api/pipeline/status",
                 "add_task": "/api/pipeline/task",
@@ -428,29 +742,10 @@ class AutomationPipeline:
     def get_mobile_config(self) -> Dict[str, Any]:
         """Configuration for mobile access."""
         return {
-            "description": "Control automation from your phone",
-            "endpoints": {
-                "GET /api/pipeline/status": "Check pipeline status",
-                "POST /api/pipeline/task": "Add new task",
-                "POST /api/pipeline/manus": "Add Manus task URL",
-                "POST /api/pipeline/process": "Process pending tasks",
-            },
-            "ios_shortcuts": [
-                {
-                    "name": "Check AgentX5 Status",
-                    "action": "GET /api/pipeline/status",
-                },
-                {
-                    "name": "Add Manus Task",
-                    "action": "POST /api/pipeline/manus",
-                    "input": "Task URL",
-                },
-            ],
-            "notifications": {
-                "on_complete": True,
-                "on_error": True,
-                "channel": "push_notification",
-            },
+            "description": _MOBILE_CONFIG["description"],
+            "endpoints": dict(_MOBILE_CONFIG["endpoints"]),
+            "ios_shortcuts": [dict(s) for s in _MOBILE_CONFIG["ios_shortcuts"]],
+            "notifications": dict(_MOBILE_CONFIG["notifications"]),
         }
 
 
@@ -20,6 +20,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from agentx5_advanced.automation._compat import DATACLASS_SLOTS
+
 
 class ProbateStage(Enum):
     """Stages of probate automation workflow."""
@@ -51,7 +53,7 @@ class DocumentType(Enum):
     INVENTORY_APPRAISAL = "inventory_appraisal"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProbateDocument:
     """Single probate document."""
     document_id: str
@@ -63,7 +65,7 @@ class ProbateDocument:
     processed_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProbateCase:
     """Probate case information."""
     case_id: str
@@ -135,6 +137,8 @@ class WorkflowStage:
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     output: Dict[str, Any] = field(default_factory=dict)
+    # Stages that must complete before this one can start
+    dependencies: List[ProbateStage] = field(default_factory=list)
 
 
 PROBATE_WORKFLOW_STAGES = [
@@ -162,6 +166,7 @@ PROBATE_WORKFLOW_STAGES = [
             "Calculate total estate value",
             "Flag any suspicious transfers",
         ],
+        dependencies=[ProbateStage.DOCUMENT_INTAKE],
     ),
     WorkflowStage(
         stage=ProbateStage.CREDITOR_NOTIFICATION,
@@ -173,6 +178,7 @@ PROBATE_WORKFLOW_STAGES = [
             "Track notification deadlines",
             "Document all notifications sent",
         ],
+        dependencies=[ProbateStage.DOCUMENT_INTAKE],
     ),
     WorkflowStage(
         stage=ProbateStage.FIDUCIARY_ANALYSIS,
@@ -186,6 +192,7 @@ PROBATE_WORKFLOW_STAGES = [
             "Calculate damages from each breach",
             "Compile evidence for court",
         ],
+        dependencies=[ProbateStage.ASSET_INVENTORY],
     ),
     WorkflowStage(
         stage=ProbateStage.DAMAGES_CALCULATION,
@@ -199,6 +206,7 @@ PROBATE_WORKFLOW_STAGES = [
             "Calculate punitive damages potential",
             "Generate CFO-verified damages schedule",
         ],
+        dependencies=[ProbateStage.FIDUCIARY_ANALYSIS],
     ),
     WorkflowStage(
         stage=ProbateStage.LEGAL_DRAFTING,
@@ -214,6 +222,10 @@ PROBATE_WORKFLOW_STAGES = [
             "Apply Bluebook citations",
             "Review for Harvard/Yale legal standards",
         ],
+        dependencies=[
+            ProbateStage.DAMAGES_CALCULATION,
+            ProbateStage.CREDITOR_NOTIFICATION,
+        ],
     ),
     WorkflowStage(
         stage=ProbateStage.COURT_FILING,
@@ -226,6 +238,7 @@ PROBATE_WORKFLOW_STAGES = [
             "Generate filing checklist",
             "Create e-filing package",
         ],
+        dependencies=[ProbateStage.LEGAL_DRAFTING],
     ),
     WorkflowStage(
         stage=ProbateStage.MONITORING,
@@ -237,10 +250,47 @@ PROBATE_WORKFLOW_STAGES = [
             "Update case status in Airtable",
             "Send notifications on key events",
         ],
+        dependencies=[ProbateStage.COURT_FILING],
     ),
 ]
 
 
+def stage_layers(stages: List[WorkflowStage]) -> List[List[WorkflowStage]]:
+    """
+    Group stages into layers that can run concurrently (Kahn's algorithm).
+
+    Each layer depends only on earlier layers. Dependencies on stages not
+    in the list are treated as already satisfied.
+    """
+    order = {s.stage: i for i, s in enumerate(stages)}
+    present = order.keys()
+    indegree = {
+        s.stage: sum(1 for dep in s.dependencies if dep in present) for s in stages
+    }
+    dependents: Dict[ProbateStage, List[WorkflowStage]] = {s.stage: [] for s in stages}
+    for s in stages:
+        for dep in s.dependencies:
+            if dep in present:
+                dependents[dep].append(s)
+
+    layers = []
+    ready = [s for s in stages if indegree[s.stage] == 0]
+    while ready:
+        layers.append(ready)
+        next_ready = []
+        for s in ready:
+            for child in dependents[s.stage]:
+                indegree[child.stage] -= 1
+                if indegree[child.stage] == 0:
+                    next_ready.append(child)
+        # Keep declaration order within a layer
+        ready = sorted(next_ready, key=lambda s: order[s.stage])
+
+    if sum(len(layer) for layer in layers) != len(stages):
+        raise ValueError("Probate workflow stages contain a dependency cycle")
+    return layers
+
+
 # ============================================================================
 # PROBATE AUTOMATION WORKFLOW ENGINE
 # ============================================================================
@@ -256,18 +306,17 @@ class ProbateAutomationWorkflow:
     def __init__(self, case: ProbateCase = None):
         self.case = case or SAM_ROBINSON_ESTATE
         self.stages = PROBATE_WORKFLOW_STAGES.copy()
-        self.current_stage_index = 0
         self.execution_log: List[Dict[str, Any]] = []
         self.box_folder = "https://app.box.com/s/8xwpb1aadk0g6f16ha02ak5yd9i9vbau"
         self.output_folder = "Google Docs / Box Output"
 
-    def log(self, message: str, level: str = "info"):
+    def log(self, message: str, level: str = "info", stage: Optional[WorkflowStage] = None):
         """Log workflow execution."""
         entry = {
             "timestamp": datetime.now().isoformat(),
             "level": level,
             "message": message,
-            "stage": self.stages[self.current_stage_index].name,
+            "stage": stage.name if stage else None,
         }
         self.execution_log.append(entry)
         print(f"[{entry['timestamp']}] [{level.upper()}] {message}")
@@ -277,7 +326,7 @@ class ProbateAutomationWorkflow:
         stage.status = "in_progress"
         stage.started_at = datetime.now().isoformat()
 
-        self.log(f"Starting stage: {stage.name}")
+        self.log(f"Starting stage: {stage.name}", stage=stage)
 
         results = {
             "stage": stage.stage.value,
@@ -286,25 +335,73 @@ class ProbateAutomationWorkflow:
             "outputs": {},
         }
 
-        for task in stage.tasks:
-            self.log(f"  Executing task: {task}")
-            # Simulate task execution
-            await asyncio.sleep(0.1)
-            results["tasks_completed"].append(task)
+        # Tasks within a stage are independent; run them together
+        task_results = await asyncio.gather(
+            *[self._run_task(stage, task) for task in stage.tasks],
+            return_exceptions=True,
+        )
+        for task, result in zip(stage.tasks, task_results):
+            if isinstance(result, Exception):
+                results.setdefault("tasks_failed", []).append(
+                    {"task": task, "error": str(result)}
+                )
+                self.log(f"  Task failed: {task}: {result}", level="error", stage=stage)
+            else:
+                results["tasks_completed"].append(result)
 
-        stage.status = "completed"
         stage.completed_at = datetime.now().isoformat()
         stage.output = results
 
-        self.log(f"Completed stage: {stage.name}")
+        if "tasks_failed" in results:
+            stage.status = "failed"
+            failed = ", ".join(f["task"] for f in results["tasks_failed"])
+            raise RuntimeError(f"Stage '{stage.name}' failed tasks: {failed}")
+
+        stage.status = "completed"
+
+        self.log(f"Completed stage: {stage.name}", stage=stage)
 
         return results
 
+    async def _run_task(self, stage: WorkflowStage, task: str) -> str:
+        """Execute a single task of a stage."""
+        self.log(f"  Executing task: {task}", stage=stage)
+        # Simulate task execution
+        await asyncio.sleep(0.1)
+        return task
+
+    async def _run_layer(self, layer: List[WorkflowStage]) -> List[Dict[str, Any]]:
+        """
+        Run independent stages concurrently, failing fast.
+
+        The first stage to fail cancels the rest of its layer (marked
+        "cancelled") and its exception is raised.
+        """
+        futures = [asyncio.ensure_future(self.execute_stage(stage)) for stage in layer]
+        try:
+            await asyncio.wait(futures, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Also reached if the workflow itself is cancelled
+            pending = [f for f in futures if not f.done()]
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        for stage, future in zip(layer, futures):
+            if future.cancelled():
+                stage.status = "cancelled"
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+
     async def execute_full_workflow(self) -> Dict[str, Any]:
         """
         Execute complete probate workflow from beginning to end.
 
-        LIVE EXECUTION - Processes all stages sequentially.
+        LIVE EXECUTION - Stages run in dependency order; independent
+        stages (e.g. asset inventory and creditor notification) run
+        concurrently.
         """
         self.log("=" * 60)
         self.log("STARTING FULL PROBATE AUTOMATION WORKFLOW")
@@ -322,15 +419,16 @@ class ProbateAutomationWorkflow:
         }
 
         try:
-            for i, stage in enumerate(self.stages):
-                self.current_stage_index = i
-                self.case.current_stage = stage.stage
+            stages_done = 0
+            for layer in stage_layers(self.stages):
+                self.case.current_stage = layer[0].stage
 
-                stage_result = await self.execute_stage(stage)
-                workflow_results["stages_completed"].append(stage_result)
+                layer_results = await self._run_layer(layer)
+                workflow_results["stages_completed"].extend(layer_results)
 
                 # Update case status
-                self.log(f"Progress: {i + 1}/{len(self.stages)} stages complete")
+                stages_done += len(layer)
+                self.log(f"Progress: {stages_done}/{len(self.stages)} stages complete")
 
             self.case.current_stage = ProbateStage.COMPLETED
             workflow_results["status"] = "completed"
@@ -13,6 +13,18 @@ from datetime import datetime
 import re
 
 
+# Date Description Amount, with dates as MM/DD/YY(YY) or MM-DD-YY(YY)
+_TX_PATTERN = re.compile(
+    r'(?P<date>\d{1,2}(?P<sep>[/-])\d{1,2}(?P=sep)\d{2,4})'
+    r'\s+(?P<description>.+?)\s+\$?(?P<amount>[\d,]+\.?\d*)'
+)
+
+# Keywords that flag a transaction for review (substring match, any case)
+_SUSPICIOUS_RE = re.compile(
+    r'transfer|wire|cash|atm|withdrawal|zelle|venmo|paypal|crypto', re.IGNORECASE
+)
+
+
 @dataclass
 class BankStatementAnalyzer:
     """
@@ -37,61 +49,53 @@ class BankStatementAnalyzer:
     def parse_statement(self, raw_text: str) -> List[Dict[str, Any]]:
         """Parse raw bank statement text into transactions."""
         lines = raw_text.strip().split('\n')
-        parsed = []
+        self.transactions = []
 
         for line in lines:
             tx = self._parse_line(line)
             if tx:
-                parsed.append(tx)
-                # Auto-flag suspicious
-                if self._is_suspicious(tx):
-                    self.flags.append(tx)
+                self.add_transaction(tx)
 
-        self.transactions = parsed
-        return parsed
+        return self.transactions
+
+    def add_transaction(self, tx: Dict[str, Any]):
+        """Append a transaction and flag it if suspicious."""
+        self.transactions.append(tx)
+        # Auto-flag suspicious
+        if self._is_suspicious(tx):
+            self.flags.append(tx)
 
     def _parse_line(self, line: str) -> Dict[str, Any]:
         """Parse single transaction line."""
-        # Pattern for common bank statement formats
-        # Date Description Amount
-        patterns = [
-            r'(\d{1,2}/\d{1,2}/\d{2,4})\s+(.+?)\s+\$?([\d,]+\.?\d*)',
-            r'(\d{1,2}-\d{1,2}-\d{2,4})\s+(.+?)\s+\$?([\d,]+\.?\d*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line)
-            if match:
-                amount = float(match.group(3).replace(',', ''))
-                return {
-                    'date': match.group(1),
-                    'description': match.group(2).strip(),
-                    'amount': amount,
-                    'type': 'withdrawal' if 'withdrawal' in line.lower() or amount < 0 else 'deposit',
-                    'raw': line,
-                }
+        match = _TX_PATTERN.search(line)
+        if match:
+            amount = float(match.group('amount').replace(',', ''))
+            return {
+                'date': match.group('date'),
+                'description': match.group('description').strip(),
+                'amount': amount,
+                'type': 'withdrawal' if 'withdrawal' in line.lower() or amount < 0 else 'deposit',
+                'raw': line,
+            }
         return None
 
     def _is_suspicious(self, tx: Dict[str, Any]) -> bool:
         """Check if transaction is suspicious."""
-        suspicious_keywords = [
-            'transfer', 'wire', 'cash', 'atm', 'withdrawal',
-            'zelle', 'venmo', 'paypal', 'crypto'
-        ]
-        desc = tx.get('description', '').lower()
-        amount = abs(tx.get('amount', 0))
-
         # Flag large transactions or suspicious keywords
-        if amount > 5000:
-            return True
-        if any(kw in desc for kw in suspicious_keywords):
+        if abs(tx.get('amount', 0)) > 5000:
             return True
-        return False
+        return _SUSPICIOUS_RE.search(tx.get('description', '')) is not None
 
     def get_summary(self) -> Dict[str, Any]:
         """Get analysis summary."""
-        total_deposits = sum(t['amount'] for t in self.transactions if t['type'] == 'deposit')
-        total_withdrawals = sum(abs(t['amount']) for t in self.transactions if t['type'] == 'withdrawal')
+        # One pass over the current transactions, so direct edits to the
+        # list are always reflected
+        total_deposits = total_withdrawals = 0.0
+        for tx in self.transactions:
+            if tx['type'] == 'deposit':
+                total_deposits += tx['amount']
+            elif tx['type'] == 'withdrawal':
+                total_withdrawals += abs(tx['amount'])
 
         return {
             'total_transactions': len(self.transactions),
@@ -180,7 +180,7 @@ class AgentX5Orchestrator:
 
         # Initialize all pillars
         for pillar, config in self.pillars.items():
-            logger.info(f"Initializing {pillar} pillar with {config['agents']} agents")
+            logger.info("Initializing %s pillar with %s agents", pillar, config["agents"])
 
         self.initialized = True
 
@@ -199,7 +199,7 @@ class AgentX5Orchestrator:
             capabilities=capabilities,
         )
         self.silent_partners[agent_id] = partner
-        logger.info(f"Registered silent partner: {agent_id}")
+        logger.info("Registered silent partner: %s", agent_id)
         return partner
 
     def get_status(self) -> Dict[str, Any]:
@@ -241,7 +241,7 @@ class AgentX5Orchestrator:
         prompt: str,
     ) -> Dict[str, Any]:
         """Execute legal document drafting via Abacus AI CLI."""
-        logger.info(f"Drafting {document_type} for case {case_number}")
+        logger.info("Drafting %s for case %s", document_type, case_number)
 
         # This would integrate with actual Abacus API
         return {
@@ -259,7 +259,7 @@ class AgentX5Orchestrator:
         exhibits: List[str],
     ) -> Dict[str, Any]:
         """Analyze damages using forensic analysis capabilities."""
-        logger.info(f"Analyzing damages for {case_matter}")
+        logger.info("Analyzing damages for %s", case_matter)
 
         return {
             "status": "analyzed",
@@ -28,6 +28,9 @@ setup(
         "pydantic",
         "pydantic_core",
     ],
+    extras_require={
+        "json": ["orjson"],
+    },
     author="Robin Wang and AgentX Team",
     author_email="contact@agentx.so",
     description="Official Python SDK for AgentX (https://www.agentx.so/)",